@@ -1,15 +1,80 @@
 """Edgee Gateway SDK for Python"""
 
+import gzip
 import json
+import math
 import os
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
 from urllib.error import HTTPError
 from urllib.request import Request, urlopen
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # API Configuration
 DEFAULT_BASE_URL = "https://api.edgee.ai"
 API_ENDPOINT = "/v1/chat/completions"
 
+# Pass as compression_rate to let the SDK pick a rate from the size of the user messages.
+# Ignored unless enable_compression is true.
+COMPRESSION_RATE_AUTO = "auto"
+
+# Request bodies smaller than this are sent uncompressed even when compress_request is enabled
+REQUEST_COMPRESSION_THRESHOLD = 8 * 1024
+
+# Default number of requests send_many() keeps in flight at once
+SEND_MANY_MAX_WORKERS = 8
+
+
+def _orjson_differs(obj) -> bool:
+    """Return whether obj holds a value orjson encodes but json.dumps does not (or differently).
+
+    orjson natively encodes UUIDs and plain Enums, which have no passthrough option,
+    and writes NaN/Infinity as null. Dataclasses and datetimes are handled by the
+    passthrough options in _dumps instead.
+    """
+    if isinstance(obj, dict):
+        return any(
+            not isinstance(k, (str, int, float, type(None))) or _orjson_differs(v)
+            for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple)):
+        return any(_orjson_differs(v) for v in obj)
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    return isinstance(obj, (UUID, Enum)) and not isinstance(obj, (int, str))
+
+
+def _raise_type_error(obj):
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj) -> bytes:
+    """Serialize a request body to JSON bytes, using orjson when it is installed.
+
+    The output and the set of accepted values match json.dumps whether or not
+    orjson is installed: anything orjson would encode differently, or that
+    json.dumps rejects (dataclasses, datetimes, UUIDs, integers wider than 64 bits),
+    is serialized by json.dumps instead, which raises TypeError where it always did.
+    """
+    if orjson is not None and not _orjson_differs(obj):
+        try:
+            return orjson.dumps(
+                obj,
+                default=_raise_type_error,
+                option=orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except TypeError:
+            pass
+    return json.dumps(obj).encode("utf-8")
+
 
 @dataclass
 class FunctionDefinition:
@@ -49,9 +114,28 @@ class InputObject:
     enable_compression: bool | None = (
         None  # Enable token compression (gateway-internal, not sent to providers)
     )
-    compression_rate: float | None = (
-        None  # Compression rate 0.0-1.0 (gateway-internal, not sent to providers)
+    compression_rate: float | str | None = (
+        None  # Compression rate 0.0-1.0 or "auto" (gateway-internal, not sent to providers)
+    )
+
+
+def _resolve_auto_compression_rate(messages: list[dict]) -> float:
+    """Pick a compression rate from the approximate token count of the user messages.
+
+    Only user messages are compressed. Short prompts keep most of their tokens to
+    protect quality, while long, multi-document inputs can be compressed harder.
+    """
+    chars = sum(
+        len(m["content"])
+        for m in messages
+        if m.get("role") == "user" and isinstance(m.get("content"), str)
     )
+    tokens = chars // 4  # ~4 characters per token for English text
+    if tokens < 500:
+        return 0.8
+    if tokens < 4000:
+        return 0.5
+    return 0.3
 
 
 @dataclass
@@ -63,23 +147,31 @@ class Choice:
 
 @dataclass
 class Usage:
-    prompt_tokens: int
-    completion_tokens: int
-    total_tokens: int
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
 
 
 @dataclass
 class Compression:
-    input_tokens: int
-    saved_tokens: int
-    rate: float
+    input_tokens: int = 0
+    saved_tokens: int = 0
+    rate: float = 0.0
+
+    @property
+    def savings_pct(self) -> float:
+        """Percentage of input tokens saved by compression."""
+        if self.input_tokens > 0:
+            return self.saved_tokens / self.input_tokens * 100
+        return 0.0
 
 
 @dataclass
 class SendResponse:
     choices: list[Choice]
-    usage: Usage | None = None
-    compression: Compression | None = None
+    # Zero-valued when the gateway does not report them, so fields can be read unconditionally
+    usage: Usage = field(default_factory=Usage)
+    compression: Compression = field(default_factory=Compression)
 
     @property
     def text(self) -> str | None:
@@ -127,6 +219,8 @@ class StreamChoice:
 @dataclass
 class StreamChunk:
     choices: list[StreamChoice]
+    usage: Usage | None = None  # Usually only present on the final chunk
+    compression: Compression | None = None  # Usually only present on the final chunk
 
     @property
     def text(self) -> str | None:
@@ -154,6 +248,7 @@ class StreamChunk:
 class EdgeeConfig:
     api_key: str | None = None
     base_url: str | None = None
+    compress_request: bool = False  # Gzip request bodies larger than REQUEST_COMPRESSION_THRESHOLD
 
 
 class Edgee:
@@ -165,21 +260,26 @@ class Edgee:
             # Backward compatibility: accept api_key as string
             api_key = config
             base_url = None
+            compress_request = False
         elif isinstance(config, EdgeeConfig):
             api_key = config.api_key
             base_url = config.base_url
+            compress_request = config.compress_request
         elif isinstance(config, dict):
             api_key = config.get("api_key")
             base_url = config.get("base_url")
+            compress_request = config.get("compress_request", False)
         else:
             api_key = None
             base_url = None
+            compress_request = False
 
         self.api_key = api_key or os.environ.get("EDGEE_API_KEY", "")
         if not self.api_key:
             raise ValueError("EDGEE_API_KEY is not set")
 
         self.base_url = base_url or os.environ.get("EDGEE_BASE_URL", DEFAULT_BASE_URL)
+        self.compress_request = compress_request
 
     def send(
         self,
@@ -232,16 +332,27 @@ class Edgee:
             body["tags"] = tags
         if enable_compression is not None:
             body["enable_compression"] = enable_compression
+        if compression_rate == COMPRESSION_RATE_AUTO:
+            # Only pick a rate when compression is on; otherwise there is nothing to tune
+            compression_rate = (
+                _resolve_auto_compression_rate(messages) if enable_compression else None
+            )
         if compression_rate is not None:
             body["compression_rate"] = compression_rate
 
+        data = _dumps(body)
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+        }
+        if self.compress_request and len(data) > REQUEST_COMPRESSION_THRESHOLD:
+            data = gzip.compress(data)
+            headers["Content-Encoding"] = "gzip"
+
         request = Request(
             f"{self.base_url}{API_ENDPOINT}",
-            data=json.dumps(body).encode("utf-8"),
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
-            },
+            data=data,
+            headers=headers,
             method="POST",
         )
 
@@ -250,6 +361,45 @@ class Edgee:
         else:
             return self._handle_non_streaming_response(request)
 
+    def send_many(
+        self,
+        requests: list[dict],
+        max_workers: int | None = None,
+    ) -> list[SendResponse]:
+        """Send several independent completion requests concurrently.
+
+        Args:
+            requests: One dict per request, each with the "model" and "input"
+                     arguments of send()
+            max_workers: Maximum number of requests in flight at once.
+                        Defaults to SEND_MANY_MAX_WORKERS.
+
+        Returns:
+            A list of SendResponse objects, in the same order as requests.
+
+        Raises:
+            ValueError: If max_workers is not positive, or a request has keys
+                       other than "model" and "input" (streaming is not supported).
+        """
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        for request in requests:
+            unexpected = set(request) - {"model", "input"}
+            if unexpected:
+                raise ValueError(
+                    f"send_many() requests only accept 'model' and 'input', got: "
+                    f"{', '.join(sorted(unexpected))}"
+                )
+
+        if not requests:
+            return []
+
+        workers = min(len(requests), max_workers or SEND_MANY_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(lambda r: self.send(model=r["model"], input=r["input"]), requests)
+            )
+
     def _handle_non_streaming_response(self, request: Request) -> SendResponse:
         """Handle non-streaming response."""
         try:
@@ -268,16 +418,16 @@ class Edgee:
             for c in data["choices"]
         ]
 
-        usage = None
-        if "usage" in data:
+        usage = Usage()
+        if data.get("usage"):
             usage = Usage(
                 prompt_tokens=data["usage"]["prompt_tokens"],
                 completion_tokens=data["usage"]["completion_tokens"],
                 total_tokens=data["usage"]["total_tokens"],
             )
 
-        compression = None
-        if "compression" in data:
+        compression = Compression()
+        if data.get("compression"):
             compression = Compression(
                 input_tokens=data["compression"]["input_tokens"],
                 saved_tokens=data["compression"]["saved_tokens"],
@@ -323,7 +473,23 @@ class Edgee:
                                 )
                                 choices.append(choice)
 
-                            yield StreamChunk(choices=choices)
+                            usage = None
+                            if data.get("usage"):
+                                usage = Usage(
+                                    prompt_tokens=data["usage"]["prompt_tokens"],
+                                    completion_tokens=data["usage"]["completion_tokens"],
+                                    total_tokens=data["usage"]["total_tokens"],
+                                )
+
+                            compression = None
+                            if data.get("compression"):
+                                compression = Compression(
+                                    input_tokens=data["compression"]["input_tokens"],
+                                    saved_tokens=data["compression"]["saved_tokens"],
+                                    rate=data["compression"]["rate"],
+                                )
+
+                            yield StreamChunk(choices=choices, usage=usage, compression=compression)
                         except json.JSONDecodeError:
                             # Skip malformed JSON
                             continue
@@ -0,0 +1 @@
+"""Runnable examples for the Edgee Python SDK"""
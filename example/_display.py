@@ -0,0 +1,76 @@
+"""Shared output helpers for the Edgee examples"""
+
+from __future__ import annotations
+
+import logging
+import logging.handlers
+import os
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from edgee import Compression, Usage
+
+BANNER_EQ = "=" * 70
+BANNER_DASH = "-" * 70
+
+log = logging.getLogger("edgee.example")
+
+
+def setup_logging() -> logging.handlers.MemoryHandler:
+    """Send example output to stdout through a buffered handler.
+
+    Records are held in memory and written out when the buffer fills, an error is
+    logged, or the handler is flushed. The level comes from the LOG_LEVEL
+    environment variable (default INFO); LOG_LEVEL=WARNING hides the diagnostic
+    output, while streamed response text is still written straight to stdout.
+    Safe to call more than once: the handler is only installed the first time.
+    """
+    for handler in log.handlers:
+        if isinstance(handler, logging.handlers.MemoryHandler):
+            return handler
+
+    target = logging.StreamHandler(sys.stdout)
+    target.setFormatter(logging.Formatter("%(message)s"))
+    handler = logging.handlers.MemoryHandler(64, flushLevel=logging.ERROR, target=target)
+    log.addHandler(handler)
+    log.propagate = False
+
+    level_name = os.environ.get("LOG_LEVEL", "INFO").upper()
+    level = logging.getLevelName(level_name)
+    if isinstance(level, int):
+        log.setLevel(level)
+    else:
+        log.setLevel(logging.INFO)
+        log.warning("Unknown LOG_LEVEL %r, using INFO", level_name)
+    return handler
+
+
+def log_usage(usage: Usage) -> None:
+    """Log token usage for a response."""
+    log.info("Token Usage:")
+    log.info("  Prompt tokens:     %s", usage.prompt_tokens)
+    log.info("  Completion tokens: %s", usage.completion_tokens)
+    log.info("  Total tokens:      %s", usage.total_tokens)
+    log.info("")
+
+
+def log_compression(compression: Compression) -> None:
+    """Log compression metrics for a response, or a hint when none were returned."""
+    if compression.input_tokens == 0:
+        log.info("No compression data available in response.")
+        log.info("Note: Compression data is only returned when compression is enabled")
+        log.info("      and supported by your API key configuration.")
+        return
+    log.info("Compression Metrics:")
+    log.info("  Input tokens:  %s", compression.input_tokens)
+    log.info("  Saved tokens:  %s", compression.saved_tokens)
+    log.info("  Compression rate: %.2f%%", compression.rate * 100)
+    log.info("  Savings: %.1f%% of input tokens saved!", compression.savings_pct)
+    log.info("")
+    log.info("  💡 Without compression, this request would have used")
+    log.info("     %s input tokens.", compression.input_tokens)
+    log.info(
+        "     With compression, only %s tokens were processed!",
+        compression.input_tokens - compression.saved_tokens,
+    )
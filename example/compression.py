@@ -1,25 +1,53 @@
 """Example: Token compression with Edgee Gateway SDK
 
 This example demonstrates how to:
-1. Enable compression for a request with a large input context
-2. Set a custom compression rate
-3. Access compression metrics from the response
+1. Enable compression only when the user message is long enough to benefit
+2. Let the SDK pick the compression rate from the input size
+3. Stream the response and read compression metrics from the final chunk
 
 IMPORTANT: Only USER messages are compressed. System messages are not compressed.
-This example includes a large context in the user message to demonstrate meaningful
-compression savings.
+Run with --context large (the default) to send a large context in the user message
+and see meaningful compression savings, or --context small for a short prompt.
 """
 
+import argparse
 import os
-import sys
+from functools import lru_cache
+
+from example._display import (
+    BANNER_DASH,
+    BANNER_EQ,
+    log,
+    log_compression,
+    log_usage,
+    setup_logging,
+)
+
+
+@lru_cache(maxsize=1)
+def get_client():
+    """Return the client configured for this example, created on the first call."""
+    from edgee import Edgee
+
+    # compress_request gzips request bodies on the wire, on top of the gateway-side
+    # token compression enabled per request below. It only applies to bodies over
+    # 8 KB (REQUEST_COMPRESSION_THRESHOLD), so this example's ~3.5 KB message is
+    # sent uncompressed; it takes effect once you pass a larger context.
+    return Edgee({"api_key": os.environ.get("EDGEE_API_KEY"), "compress_request": True})
+
+
+SMALL_PROMPT = "Explain quantum computing in simple terms."
 
-# Add parent directory to path for local testing
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Compressing a prompt of a few dozen tokens cannot save more than a handful of
+# them, and the gateway still pays for running the compression model. Below
+# this size the request is sent uncompressed.
+MIN_COMPRESSION_CHARS = 512
 
-from edgee import Edgee
 
-# Initialize the client
-edgee = Edgee(os.environ.get("EDGEE_API_KEY"))
+def should_compress(message: str, min_chars: int = MIN_COMPRESSION_CHARS) -> bool:
+    """Return whether a user message is long enough for compression to pay off."""
+    return len(message) >= min_chars
+
 
 # Large context document to demonstrate input compression
 LARGE_CONTEXT = """
@@ -67,69 +95,85 @@ will likely deepen, raising important questions about human-AI collaboration,
 workforce transformation, and the future of human cognition itself.
 """
 
-print("=" * 70)
-print("Edgee Token Compression Example")
-print("=" * 70)
-print()
-
-# Example: Request with compression enabled and large input
-print("Example: Large user message with compression enabled")
-print("-" * 70)
-print(f"Input context length: {len(LARGE_CONTEXT)} characters")
-print()
-
 # NOTE: Only USER messages are compressed
-# Put the large context in the user message to demonstrate compression
-user_message = f"""Here is some context about AI:
-
-{LARGE_CONTEXT}
-
-Based on this context, summarize the key milestones in AI development in 3 bullet points."""
-
-response = edgee.send(
-    model="gpt-4o",
-    input={
-        "messages": [
-            {"role": "user", "content": user_message},
-        ],
-        "enable_compression": True,
-        "compression_rate": 0.5,
-    },
+# Put the large context in the user message to demonstrate compression.
+# The message is built once at import time so a loop asking several questions
+# against the same context does not rebuild it on every request.
+PREFIX = "Here is some context about AI:\n\n"
+SUFFIX = (
+    "\n\nBased on this context, summarize the key milestones in AI development in 3 bullet points."
 )
+USER_MESSAGE = "".join((PREFIX, LARGE_CONTEXT, SUFFIX))
 
-print(f"Response: {response.text}")
-print()
-
-# Display usage information
-if response.usage:
-    print("Token Usage:")
-    print(f"  Prompt tokens:     {response.usage.prompt_tokens}")
-    print(f"  Completion tokens: {response.usage.completion_tokens}")
-    print(f"  Total tokens:      {response.usage.total_tokens}")
-    print()
-
-# Display compression information
-if response.compression:
-    print("Compression Metrics:")
-    print(f"  Input tokens:  {response.compression.input_tokens}")
-    print(f"  Saved tokens:  {response.compression.saved_tokens}")
-    print(f"  Compression rate: {response.compression.rate:.2%}")
-    savings_pct = (
-        (response.compression.saved_tokens / response.compression.input_tokens * 100)
-        if response.compression.input_tokens > 0
-        else 0
+
+def main():
+    from edgee import Compression, Usage
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--context",
+        choices=("small", "large"),
+        default="large",
+        help="size of the user message to compress (default: large)",
     )
-    print(f"  Savings: {savings_pct:.1f}% of input tokens saved!")
-    print()
-    print("  💡 Without compression, this request would have used")
-    print(f"     {response.compression.input_tokens} input tokens.")
-    print(
-        f"     With compression, only {response.compression.input_tokens - response.compression.saved_tokens} tokens were processed!"
+    args = parser.parse_args()
+
+    if args.context == "large":
+        context = LARGE_CONTEXT
+        user_message = USER_MESSAGE
+    else:
+        context = SMALL_PROMPT
+        user_message = SMALL_PROMPT
+
+    handler = setup_logging()
+    edgee = get_client()
+
+    enable_compression = should_compress(user_message)
+
+    log.info(BANNER_EQ)
+    log.info("Edgee Token Compression Example")
+    log.info(BANNER_EQ)
+    log.info("")
+    log.info(
+        "Example: %s user message, compression %s",
+        args.context.capitalize(),
+        "enabled" if enable_compression else "skipped (below threshold)",
     )
-else:
-    print("No compression data available in response.")
-    print("Note: Compression data is only returned when compression is enabled")
-    print("      and supported by your API key configuration.")
-
-print()
-print("=" * 70)
+    log.info(BANNER_DASH)
+    log.info("Input context length: %s characters", len(context))
+    log.info("")
+
+    # Stream the answer so text is shown as soon as the first tokens arrive;
+    # usage and compression metrics come with the final chunk
+    usage = Usage()
+    compression = Compression()
+    handler.flush()
+    print("Response: ", end="", flush=True)
+    for chunk in edgee.stream(
+        model="gpt-4o",
+        input={
+            "messages": [
+                {"role": "user", "content": user_message},
+            ],
+            "enable_compression": enable_compression,
+            "compression_rate": "auto",
+        },
+    ):
+        if chunk.text:
+            print(chunk.text, end="", flush=True)
+        if chunk.usage:
+            usage = chunk.usage
+        if chunk.compression:
+            compression = chunk.compression
+    print("\n")
+
+    log_usage(usage)
+    log_compression(compression)
+
+    log.info("")
+    log.info(BANNER_EQ)
+    handler.flush()
+
+
+if __name__ == "__main__":
+    main()
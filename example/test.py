@@ -1,71 +1,204 @@
 """Example usage of Edgee Gateway SDK"""
 
+import argparse
+import hashlib
+import json
 import os
-import sys
-
-# Add parent directory to path for local testing
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from edgee import Edgee
-
-edgee = Edgee(os.environ.get("EDGEE_API_KEY", "test-key"))
-
-# Test 1: Simple string input
-print("Test 1: Simple string input")
-response1 = edgee.send(
-    model="mistral/mistral-small-latest",
-    input="What is the capital of France?",
-)
-print(f"Content: {response1.text}")
-print(f"Usage: {response1.usage}")
-print()
-
-# Test 2: Full input object with messages
-print("Test 2: Full input object with messages")
-response2 = edgee.send(
-    model="mistral/mistral-small-latest",
-    input={
-        "messages": [
-            {"role": "system", "content": "You are a helpful assistant."},
-            {"role": "user", "content": "Say hello!"},
-        ],
+import tempfile
+import time
+from dataclasses import asdict
+from functools import lru_cache
+
+from example._display import log, log_usage, setup_logging
+
+
+@lru_cache(maxsize=1)
+def get_client():
+    """Build the client on first use; the SDK import is deferred to this call as well."""
+    from edgee import Edgee
+
+    return Edgee(os.environ.get("EDGEE_API_KEY", "test-key"))
+
+
+# Responses to Tests 1-3 are cached on disk so reruns within the TTL skip the API.
+# Entries are stored as plain JSON and rebuilt into SendResponse objects on load.
+CACHE_PATH = os.path.expanduser("~/.edgee-example-cache.json")
+CACHE_TTL = 60 * 60  # seconds
+
+
+def request_key(request: dict, base_url: str) -> str:
+    """Return a stable cache key for a send() request (model, input and its options).
+
+    The gateway URL is part of the key so responses from different gateways are not mixed.
+    """
+    payload = json.dumps({"base_url": base_url, "request": request}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _read_cache() -> dict:
+    try:
+        with open(CACHE_PATH, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_cache(cache: dict) -> None:
+    # Write to a temporary file and rename it so an interrupted write never leaves a partial cache
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(CACHE_PATH), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, CACHE_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        log.warning("Could not write response cache %s: %s", CACHE_PATH, e)
+
+
+def _response_from_dict(data: dict):
+    from edgee import Choice, Compression, SendResponse, Usage
+
+    return SendResponse(
+        choices=[Choice(**choice) for choice in data["choices"]],
+        usage=Usage(**data["usage"]),
+        compression=Compression(**data["compression"]),
+    )
+
+
+def load_cached_responses(keys: list[str]) -> dict:
+    """Return the cached, unexpired responses for the given keys.
+
+    Expired or unreadable entries are removed from the cache file.
+    """
+    now = time.time()
+    cache = _read_cache()
+    responses = {}
+    fresh = {}
+    for key, entry in cache.items():
+        try:
+            if now - entry["stored_at"] >= CACHE_TTL:
+                continue
+            if key in keys:
+                responses[key] = _response_from_dict(entry["response"])
+        except (KeyError, TypeError):
+            continue
+        fresh[key] = entry
+    if len(fresh) != len(cache):
+        _write_cache(fresh)
+    return responses
+
+
+def store_responses(responses: dict) -> None:
+    """Cache responses by request key."""
+    now = time.time()
+    cache = _read_cache()
+    for key, response in responses.items():
+        cache[key] = {"stored_at": now, "response": asdict(response)}
+    _write_cache(cache)
+
+
+# Defined once and reused by every request that needs the default system prompt
+SYSTEM_MESSAGE = {"role": "system", "content": "You are a helpful assistant."}
+
+# Tests 1-3 are independent, so they are sent together with send_many() and printed in order
+REQUESTS = [
+    # Test 1: Simple string input
+    {
+        "model": "mistral/mistral-small-latest",
+        "input": "What is the capital of France?",
     },
-)
-print(f"Content: {response2.text}")
-print()
-
-# Test 3: With tools
-print("Test 3: With tools")
-response3 = edgee.send(
-    model="gpt-4o",
-    input={
-        "messages": [{"role": "user", "content": "What is the weather in Paris?"}],
-        "tools": [
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_weather",
-                    "description": "Get the current weather for a location",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "location": {"type": "string", "description": "City name"},
+    # Test 2: Full input object with messages
+    {
+        "model": "mistral/mistral-small-latest",
+        "input": {
+            "messages": [
+                SYSTEM_MESSAGE,
+                {"role": "user", "content": "Say hello!"},
+            ],
+        },
+    },
+    # Test 3: With tools
+    {
+        "model": "gpt-4o",
+        "input": {
+            "messages": [{"role": "user", "content": "What is the weather in Paris?"}],
+            "tools": [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": "get_weather",
+                        "description": "Get the current weather for a location",
+                        "parameters": {
+                            "type": "object",
+                            "properties": {
+                                "location": {"type": "string", "description": "City name"},
+                            },
+                            "required": ["location"],
                         },
-                        "required": ["location"],
                     },
                 },
-            },
-        ],
-        "tool_choice": "auto",
+            ],
+            "tool_choice": "auto",
+        },
     },
-)
-print(f"Content: {response3.text}")
-print(f"Tool calls: {response3.tool_calls}")
-print()
-
-# Test 4: Streaming
-print("Test 4: Streaming")
-for chunk in edgee.stream(model="mistral/mistral-small-latest", input="What is Python?"):
-    if chunk.text:
-        print(chunk.text, end="", flush=True)
-print("\n")
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always call the API instead of reusing cached responses",
+    )
+    args = parser.parse_args()
+
+    handler = setup_logging()
+    edgee = get_client()
+
+    requests_by_key = {request_key(request, edgee.base_url): request for request in REQUESTS}
+    responses = {} if args.no_cache else load_cached_responses(list(requests_by_key))
+    missing = [key for key in requests_by_key if key not in responses]
+
+    if missing:
+        fetched = edgee.send_many([requests_by_key[key] for key in missing])
+        fetched = dict(zip(missing, fetched, strict=True))
+        if not args.no_cache:
+            store_responses(fetched)
+        responses.update(fetched)
+
+    response1, response2, response3 = (responses[key] for key in requests_by_key)
+
+    # Test 1: Simple string input
+    log.info("Test 1: Simple string input")
+    log.info("Content: %s", response1.text)
+    log.info("")
+    log_usage(response1.usage)
+
+    # Test 2: Full input object with messages
+    log.info("Test 2: Full input object with messages")
+    log.info("Content: %s", response2.text)
+    log.info("")
+
+    # Test 3: With tools
+    log.info("Test 3: With tools")
+    log.info("Content: %s", response3.text)
+    log.info("Tool calls: %s", response3.tool_calls)
+    log.info("")
+
+    # Test 4: Streaming
+    log.info("Test 4: Streaming")
+    # Log records are buffered, so flush them first to keep them above the streamed text
+    handler.flush()
+    for chunk in edgee.stream(model="mistral/mistral-small-latest", input="What is Python?"):
+        if chunk.text:
+            print(chunk.text, end="", flush=True)
+    print("\n")
+
+
+if __name__ == "__main__":
+    main()
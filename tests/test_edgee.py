@@ -1,12 +1,31 @@
 """Tests for Edgee SDK"""
 
+import gzip
 import json
 import os
+from datetime import date, datetime
+from enum import Enum
 from unittest.mock import MagicMock, patch
+from uuid import UUID
 
 import pytest
 
-from edgee import Edgee, EdgeeConfig
+import edgee
+from edgee import (
+    REQUEST_COMPRESSION_THRESHOLD,
+    SEND_MANY_MAX_WORKERS,
+    Compression,
+    Edgee,
+    EdgeeConfig,
+    InputObject,
+    Message,
+    Usage,
+    _dumps,
+)
+
+
+class Color(Enum):
+    RED = "red"
 
 
 class TestEdgeeConstructor:
@@ -63,6 +82,28 @@ class TestEdgeeConstructor:
         assert isinstance(client, Edgee)
 
 
+class TestCompression:
+    """Test Compression metrics"""
+
+    def test_savings_pct(self):
+        """Should report saved tokens as a percentage of input tokens"""
+        compression = Compression(input_tokens=200, saved_tokens=50, rate=0.75)
+        assert compression.savings_pct == 25.0
+
+    def test_savings_pct_reflects_updated_fields(self):
+        """Should recompute savings when the metrics change"""
+        compression = Compression()
+        assert compression.savings_pct == 0.0
+        compression.input_tokens = 100
+        compression.saved_tokens = 50
+        assert compression.savings_pct == 50.0
+
+    def test_savings_pct_without_input_tokens(self):
+        """Should report no savings when there were no input tokens"""
+        compression = Compression(input_tokens=0, saved_tokens=0, rate=0.0)
+        assert compression.savings_pct == 0.0
+
+
 class TestEdgeeSend:
     """Test Edgee.send method"""
 
@@ -213,9 +254,31 @@ class TestEdgeeSend:
         client = Edgee("test-api-key")
         result = client.send(model="gpt-4", input="Test")
 
-        assert result.usage is None
+        assert result.usage == Usage(prompt_tokens=0, completion_tokens=0, total_tokens=0)
         assert len(result.choices) == 1
 
+    @patch("edgee.urlopen")
+    def test_send_with_null_usage_and_compression(self, mock_urlopen):
+        """Should treat null usage and compression like missing ones"""
+        mock_response_data = {
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "Response"},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": None,
+            "compression": None,
+        }
+        mock_urlopen.return_value = self._mock_response(mock_response_data)
+
+        client = Edgee("test-api-key")
+        result = client.send(model="gpt-4", input="Test")
+
+        assert result.usage == Usage()
+        assert result.compression == Compression()
+
     @patch("edgee.urlopen")
     def test_send_with_multiple_choices(self, mock_urlopen):
         """Should handle multiple choices in response"""
@@ -334,6 +397,7 @@ class TestEdgeeSend:
         assert result.compression.input_tokens == 100
         assert result.compression.saved_tokens == 42
         assert result.compression.rate == 0.6102003642987249
+        assert result.compression.savings_pct == 42.0
 
     @patch("edgee.urlopen")
     def test_send_without_compression_response(self, mock_urlopen):
@@ -352,4 +416,417 @@ class TestEdgeeSend:
         client = Edgee("test-api-key")
         result = client.send(model="gpt-4", input="Test")
 
-        assert result.compression is None
+        assert result.compression == Compression(input_tokens=0, saved_tokens=0, rate=0.0)
+        assert result.compression.savings_pct == 0.0
+
+    @patch("edgee.urlopen")
+    def test_send_with_auto_compression_rate(self, mock_urlopen):
+        """Should resolve compression_rate="auto" from the size of the user messages"""
+        mock_response_data = {
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "Response"},
+                    "finish_reason": "stop",
+                }
+            ],
+        }
+        client = Edgee("test-api-key")
+
+        for content, expected_rate in [
+            ("Short question", 0.8),
+            ("x" * 4 * 1000, 0.5),
+            ("x" * 4 * 5000, 0.3),
+        ]:
+            mock_urlopen.return_value = self._mock_response(mock_response_data)
+            client.send(
+                model="gpt-4",
+                input={
+                    "messages": [
+                        {"role": "system", "content": "y" * 4 * 5000},
+                        {"role": "user", "content": content},
+                    ],
+                    "enable_compression": True,
+                    "compression_rate": "auto",
+                },
+            )
+
+            call_args = mock_urlopen.call_args[0][0]
+            body = json.loads(call_args.data.decode("utf-8"))
+            assert body["compression_rate"] == expected_rate
+
+    @patch("edgee.urlopen")
+    def test_send_auto_compression_rate_without_compression(self, mock_urlopen):
+        """Should not send compression_rate="auto" when compression is disabled"""
+        mock_response_data = {
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "Response"},
+                    "finish_reason": "stop",
+                }
+            ],
+        }
+        mock_urlopen.return_value = self._mock_response(mock_response_data)
+
+        client = Edgee("test-api-key")
+        client.send(
+            model="gpt-4",
+            input={
+                "messages": [{"role": "user", "content": "Short question"}],
+                "enable_compression": False,
+                "compression_rate": "auto",
+            },
+        )
+
+        call_args = mock_urlopen.call_args[0][0]
+        body = json.loads(call_args.data.decode("utf-8"))
+        assert body["enable_compression"] is False
+        assert "compression_rate" not in body
+
+    @patch("edgee.orjson", None)
+    @patch("edgee.urlopen")
+    def test_send_without_orjson(self, mock_urlopen):
+        """Should serialize the request body with the json module when orjson is missing"""
+        mock_response_data = {
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "Response"},
+                    "finish_reason": "stop",
+                }
+            ],
+        }
+        mock_urlopen.return_value = self._mock_response(mock_response_data)
+
+        client = Edgee("test-api-key")
+        client.send(model="gpt-4", input="Hello")
+
+        call_args = mock_urlopen.call_args[0][0]
+        assert call_args.data == json.dumps(
+            {"model": "gpt-4", "messages": [{"role": "user", "content": "Hello"}]}
+        ).encode("utf-8")
+
+    @patch("edgee.orjson")
+    @patch("edgee.urlopen")
+    def test_send_with_orjson(self, mock_urlopen, mock_orjson):
+        """Should serialize the request body with orjson when it is installed"""
+        mock_response_data = {
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "Response"},
+                    "finish_reason": "stop",
+                }
+            ],
+        }
+        mock_urlopen.return_value = self._mock_response(mock_response_data)
+        mock_orjson.dumps.return_value = b'{"serialized":"by orjson"}'
+
+        client = Edgee("test-api-key")
+        client.send(model="gpt-4", input="Hello")
+
+        mock_orjson.dumps.assert_called_once()
+        assert mock_orjson.dumps.call_args.args == (
+            {"model": "gpt-4", "messages": [{"role": "user", "content": "Hello"}]},
+        )
+        call_args = mock_urlopen.call_args[0][0]
+        assert call_args.data == b'{"serialized":"by orjson"}'
+
+    @patch("edgee.urlopen")
+    def test_send_does_not_compress_request_by_default(self, mock_urlopen):
+        """Should send an uncompressed body unless compress_request is enabled"""
+        mock_response_data = {
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "Response"},
+                    "finish_reason": "stop",
+                }
+            ],
+        }
+        mock_urlopen.return_value = self._mock_response(mock_response_data)
+
+        client = Edgee("test-api-key")
+        client.send(model="gpt-4", input="x" * (REQUEST_COMPRESSION_THRESHOLD * 2))
+
+        call_args = mock_urlopen.call_args[0][0]
+        assert call_args.get_header("Content-encoding") is None
+        body = json.loads(call_args.data.decode("utf-8"))
+        assert body["messages"][0]["content"] == "x" * (REQUEST_COMPRESSION_THRESHOLD * 2)
+
+    @patch("edgee.urlopen")
+    def test_send_compresses_large_request(self, mock_urlopen):
+        """Should gzip request bodies above the threshold when compress_request is enabled"""
+        mock_response_data = {
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "Response"},
+                    "finish_reason": "stop",
+                }
+            ],
+        }
+        mock_urlopen.return_value = self._mock_response(mock_response_data)
+
+        client = Edgee({"api_key": "test-key", "compress_request": True})
+        large_input = "x" * (REQUEST_COMPRESSION_THRESHOLD * 2)
+        client.send(model="gpt-4", input=large_input)
+
+        call_args = mock_urlopen.call_args[0][0]
+        assert call_args.get_header("Content-encoding") == "gzip"
+        body = json.loads(gzip.decompress(call_args.data).decode("utf-8"))
+        assert body["messages"] == [{"role": "user", "content": large_input}]
+
+    @patch("edgee.urlopen")
+    def test_send_does_not_compress_small_request(self, mock_urlopen):
+        """Should leave request bodies below the threshold uncompressed"""
+        mock_response_data = {
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "Response"},
+                    "finish_reason": "stop",
+                }
+            ],
+        }
+        mock_urlopen.return_value = self._mock_response(mock_response_data)
+
+        client = Edgee(EdgeeConfig(api_key="test-key", compress_request=True))
+        client.send(model="gpt-4", input="Hello")
+
+        call_args = mock_urlopen.call_args[0][0]
+        assert call_args.get_header("Content-encoding") is None
+        body = json.loads(call_args.data.decode("utf-8"))
+        assert body["messages"] == [{"role": "user", "content": "Hello"}]
+
+
+class TestDumps:
+    """Test request body serialization"""
+
+    def test_orjson_matches_json(self):
+        """Should produce the same JSON with real orjson as with the json module"""
+        pytest.importorskip("orjson")
+        body = {
+            "model": "gpt-4o",
+            "messages": [{"role": "user", "content": "What is the weather in Paris? ☀️"}],
+            "tools": [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": "get_weather",
+                        "description": "Get the current weather for a location",
+                        "parameters": {
+                            "type": "object",
+                            "properties": {
+                                "location": {"type": "string", "description": "City name"},
+                                "days": {"type": "integer", "minimum": 1, "maximum": 7},
+                            },
+                            "required": ["location"],
+                        },
+                    },
+                }
+            ],
+            "tool_choice": "auto",
+            "compression_rate": 0.5,
+            "metadata": {1: "int key", "big": 2**70, "flag": True, "none": None},
+        }
+
+        assert json.loads(_dumps(body)) == json.loads(json.dumps(body))
+
+    def test_orjson_stringifies_non_str_keys(self):
+        """Should accept non-string dict keys like json.dumps"""
+        pytest.importorskip("orjson")
+        assert json.loads(_dumps({"a": {1: "x"}})) == {"a": {"1": "x"}}
+
+    def test_orjson_falls_back_for_big_integers(self):
+        """Should fall back to json.dumps for integers orjson cannot encode"""
+        pytest.importorskip("orjson")
+        assert _dumps({"n": 2**70}) == json.dumps({"n": 2**70}).encode("utf-8")
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), -float("inf")])
+    def test_orjson_matches_json_for_non_finite_floats(self, value):
+        """Should encode NaN and infinities exactly as json.dumps does"""
+        pytest.importorskip("orjson")
+        assert _dumps({"x": value}) == json.dumps({"x": value}).encode("utf-8")
+
+    @pytest.mark.parametrize("with_orjson", [True, False])
+    @pytest.mark.parametrize(
+        "value",
+        [
+            Message(role="user", content="Hello"),
+            date(2024, 1, 1),
+            datetime(2024, 1, 1, 12, 0),
+            UUID(int=1),
+            Color.RED,
+            {UUID(int=1): "key"},
+        ],
+    )
+    def test_rejects_what_json_rejects(self, value, with_orjson):
+        """Should raise TypeError for values json.dumps rejects, with or without orjson"""
+        if with_orjson:
+            pytest.importorskip("orjson")
+            with pytest.raises(TypeError):
+                _dumps({"x": value})
+        else:
+            with patch("edgee.orjson", None), pytest.raises(TypeError):
+                _dumps({"x": value})
+
+    @pytest.mark.parametrize("with_orjson", [True, False])
+    @patch("edgee.urlopen")
+    def test_send_rejects_message_instances(self, mock_urlopen, with_orjson):
+        """Should raise TypeError for Message objects in the body, with or without orjson"""
+        if with_orjson:
+            pytest.importorskip("orjson")
+        client = Edgee("test-api-key")
+        with patch("edgee.orjson", edgee.orjson if with_orjson else None):
+            with pytest.raises(TypeError):
+                client.send(
+                    model="gpt-4",
+                    input=InputObject(messages=[Message(role="user", content="Hello")]),
+                )
+        mock_urlopen.assert_not_called()
+
+
+class TestEdgeeSendMany:
+    """Test Edgee.send_many method"""
+
+    def setup_method(self):
+        os.environ.pop("EDGEE_API_KEY", None)
+        os.environ.pop("EDGEE_BASE_URL", None)
+
+    def _echo_response(self, request):
+        """Create a mock response echoing the request's user message"""
+        body = json.loads(request.data.decode("utf-8"))
+        data = {
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": body["messages"][-1]["content"]},
+                    "finish_reason": "stop",
+                }
+            ],
+        }
+        mock = MagicMock()
+        mock.read.return_value = json.dumps(data).encode("utf-8")
+        mock.__enter__ = MagicMock(return_value=mock)
+        mock.__exit__ = MagicMock(return_value=False)
+        return mock
+
+    @patch("edgee.urlopen")
+    def test_send_many_preserves_order(self, mock_urlopen):
+        """Should return one response per request, in request order"""
+        mock_urlopen.side_effect = self._echo_response
+
+        client = Edgee("test-api-key")
+        results = client.send_many(
+            [
+                {"model": "gpt-4", "input": "First"},
+                {"model": "gpt-4", "input": {"messages": [{"role": "user", "content": "Second"}]}},
+                {"model": "gpt-4", "input": "Third"},
+            ]
+        )
+
+        assert [result.text for result in results] == ["First", "Second", "Third"]
+        assert mock_urlopen.call_count == 3
+
+    @patch("edgee.ThreadPoolExecutor")
+    def test_send_many_bounds_workers(self, mock_executor):
+        """Should cap the thread pool at SEND_MANY_MAX_WORKERS by default"""
+        mock_executor.return_value.__enter__.return_value.map.return_value = []
+        client = Edgee("test-api-key")
+
+        client.send_many([{"model": "gpt-4", "input": "Hi"}] * 100)
+        mock_executor.assert_called_with(max_workers=SEND_MANY_MAX_WORKERS)
+
+        client.send_many([{"model": "gpt-4", "input": "Hi"}] * 2)
+        mock_executor.assert_called_with(max_workers=2)
+
+        client.send_many([{"model": "gpt-4", "input": "Hi"}] * 100, max_workers=20)
+        mock_executor.assert_called_with(max_workers=20)
+
+    @patch("edgee.urlopen")
+    def test_send_many_rejects_non_positive_max_workers(self, mock_urlopen):
+        """Should reject max_workers <= 0"""
+        client = Edgee("test-api-key")
+        with pytest.raises(ValueError, match="max_workers must be greater than 0"):
+            client.send_many([{"model": "gpt-4", "input": "Hi"}], max_workers=0)
+        mock_urlopen.assert_not_called()
+
+    @patch("edgee.urlopen")
+    def test_send_many_rejects_unknown_keys(self, mock_urlopen):
+        """Should reject request keys other than model and input"""
+        client = Edgee("test-api-key")
+        with pytest.raises(ValueError, match="got: stream"):
+            client.send_many([{"model": "gpt-4", "input": "Hi", "stream": True}])
+        mock_urlopen.assert_not_called()
+
+    @patch("edgee.urlopen")
+    def test_send_many_with_no_requests(self, mock_urlopen):
+        """Should return an empty list without calling the API"""
+        client = Edgee("test-api-key")
+        assert client.send_many([]) == []
+        mock_urlopen.assert_not_called()
+
+
+class TestEdgeeStream:
+    """Test Edgee.stream method"""
+
+    def setup_method(self):
+        os.environ.pop("EDGEE_API_KEY", None)
+        os.environ.pop("EDGEE_BASE_URL", None)
+
+    def _mock_stream_response(self, events: list[dict]):
+        """Create a mock SSE response"""
+        lines = [f"data: {json.dumps(event)}\n".encode() for event in events]
+        lines.append(b"data: [DONE]\n")
+        mock = MagicMock()
+        mock.__iter__.return_value = iter(lines)
+        mock.__enter__ = MagicMock(return_value=mock)
+        mock.__exit__ = MagicMock(return_value=False)
+        return mock
+
+    @patch("edgee.urlopen")
+    def test_stream_yields_chunks(self, mock_urlopen):
+        """Should yield a StreamChunk per SSE event and stop at [DONE]"""
+        mock_urlopen.return_value = self._mock_stream_response(
+            [
+                {"choices": [{"index": 0, "delta": {"role": "assistant", "content": "Hello"}}]},
+                {"choices": [{"index": 0, "delta": {"content": " world"}}]},
+                {"choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]},
+            ]
+        )
+
+        client = Edgee("test-api-key")
+        chunks = list(client.stream(model="gpt-4", input="Hello"))
+
+        assert "".join(chunk.text or "" for chunk in chunks) == "Hello world"
+        assert chunks[0].role == "assistant"
+        assert chunks[-1].finish_reason == "stop"
+        assert chunks[-1].usage is None
+        assert chunks[-1].compression is None
+
+        call_args = mock_urlopen.call_args[0][0]
+        body = json.loads(call_args.data.decode("utf-8"))
+        assert body["stream"] is True
+
+    @patch("edgee.urlopen")
+    def test_stream_final_chunk_metrics(self, mock_urlopen):
+        """Should parse usage and compression when present on a chunk"""
+        mock_urlopen.return_value = self._mock_stream_response(
+            [
+                {"choices": [{"index": 0, "delta": {"content": "Hi"}}]},
+                {
+                    "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                    "usage": {"prompt_tokens": 100, "completion_tokens": 5, "total_tokens": 105},
+                    "compression": {"input_tokens": 100, "saved_tokens": 42, "rate": 0.58},
+                },
+            ]
+        )
+
+        client = Edgee("test-api-key")
+        chunks = list(client.stream(model="gpt-4", input="Hello"))
+
+        assert chunks[0].usage is None
+        assert chunks[-1].usage.total_tokens == 105
+        assert chunks[-1].compression.saved_tokens == 42
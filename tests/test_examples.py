@@ -0,0 +1,142 @@
+"""Tests for the example scripts"""
+
+import importlib
+import json
+import logging
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from edgee import Choice, Compression, SendResponse, Usage
+
+EXAMPLE_MODULES = ["example.test", "example.compression"]
+
+
+class TestExampleImports:
+    """Test that importing the examples has no side effects"""
+
+    def setup_method(self):
+        # Building a client without an API key raises, so any client setup at import fails loudly
+        os.environ.pop("EDGEE_API_KEY", None)
+        for name in [*EXAMPLE_MODULES, "example._display"]:
+            sys.modules.pop(name, None)
+
+    @pytest.mark.parametrize("module_name", EXAMPLE_MODULES)
+    def test_import_does_no_client_setup(self, module_name):
+        """Should import without building a client or calling the API"""
+        with patch("edgee.Edgee") as mock_edgee, patch("edgee.urlopen") as mock_urlopen:
+            module = importlib.import_module(module_name)
+
+        mock_edgee.assert_not_called()
+        mock_urlopen.assert_not_called()
+        assert module.get_client.cache_info().currsize == 0
+
+
+class TestExampleResponseCache:
+    """Test the example/test.py response cache"""
+
+    def _response(self):
+        return SendResponse(
+            choices=[
+                Choice(
+                    index=0,
+                    message={"role": "assistant", "content": "Paris"},
+                    finish_reason="stop",
+                )
+            ],
+            usage=Usage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+        )
+
+    def test_round_trip(self, tmp_path):
+        """Should store responses as JSON and rebuild them on load"""
+        example = importlib.import_module("example.test")
+        cache_path = tmp_path / "cache.json"
+        with patch.object(example, "CACHE_PATH", str(cache_path)):
+            example.store_responses({"key": self._response()})
+            loaded = example.load_cached_responses(["key", "missing"])
+
+        assert json.loads(cache_path.read_text())["key"]["response"]["usage"]["total_tokens"] == 15
+        assert loaded == {"key": self._response()}
+        assert loaded["key"].compression == Compression()
+
+    def test_expired_entries_are_removed(self, tmp_path):
+        """Should drop expired and unreadable entries from the cache file"""
+        example = importlib.import_module("example.test")
+        cache_path = tmp_path / "cache.json"
+        with patch.object(example, "CACHE_PATH", str(cache_path)):
+            example.store_responses({"fresh": self._response(), "old": self._response()})
+            cache = json.loads(cache_path.read_text())
+            cache["old"]["stored_at"] -= example.CACHE_TTL + 1
+            cache["broken"] = {"stored_at": cache["fresh"]["stored_at"], "response": {}}
+            cache_path.write_text(json.dumps(cache))
+
+            loaded = example.load_cached_responses(["fresh", "old", "broken"])
+
+        assert list(loaded) == ["fresh"]
+        assert list(json.loads(cache_path.read_text())) == ["fresh"]
+
+    def test_key_includes_base_url(self):
+        """Should key the same request differently for different gateways"""
+        example = importlib.import_module("example.test")
+        request = example.REQUESTS[0]
+
+        assert example.request_key(request, "https://a.example") == example.request_key(
+            request, "https://a.example"
+        )
+        assert example.request_key(request, "https://a.example") != example.request_key(
+            request, "https://b.example"
+        )
+
+    def test_unwritable_cache_is_ignored(self, tmp_path):
+        """Should log a warning instead of raising when the cache cannot be written"""
+        example = importlib.import_module("example.test")
+        cache_path = tmp_path / "missing-dir" / "cache.json"
+        with (
+            patch.object(example, "CACHE_PATH", str(cache_path)),
+            patch.object(example.log, "warning") as mock_warning,
+        ):
+            example.store_responses({"key": self._response()})
+
+        mock_warning.assert_called_once()
+        assert not cache_path.exists()
+
+
+class TestExampleLogging:
+    """Test the example logging setup"""
+
+    def setup_method(self):
+        self.display = importlib.import_module("example._display")
+        self._reset()
+
+    def teardown_method(self):
+        self._reset()
+
+    def _reset(self):
+        for handler in list(self.display.log.handlers):
+            self.display.log.removeHandler(handler)
+        self.display.log.setLevel(logging.NOTSET)
+
+    def test_setup_is_idempotent(self):
+        """Should install a single handler however many times it is called"""
+        first = self.display.setup_logging()
+        second = self.display.setup_logging()
+
+        assert first is second
+        assert self.display.log.handlers == [first]
+
+    @patch.dict(os.environ, {"LOG_LEVEL": "warning"})
+    def test_level_from_env(self):
+        """Should read the level from LOG_LEVEL"""
+        self.display.setup_logging()
+        assert self.display.log.level == logging.WARNING
+
+    @patch.dict(os.environ, {"LOG_LEVEL": "LOUD"})
+    def test_invalid_level_falls_back_to_info(self):
+        """Should fall back to INFO instead of raising on an unknown LOG_LEVEL"""
+        handler = self.display.setup_logging()
+        assert self.display.log.level == logging.INFO
+        assert [record.getMessage() for record in handler.buffer] == [
+            "Unknown LOG_LEVEL 'LOUD', using INFO"
+        ]